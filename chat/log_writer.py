@@ -0,0 +1,103 @@
+"""
+Background writer for SecurityLog entries.
+
+Views hand log records to a queue instead of inserting them on the request
+path; a daemon thread drains the queue and writes each batch with a single
+bulk_create.
+"""
+import atexit
+import logging
+import queue
+import threading
+
+from django.db import DatabaseError, close_old_connections
+
+logger = logging.getLogger(__name__)
+
+
+class SecurityLogWriter:
+    """Buffers SecurityLog records and inserts them in batches."""
+
+    BATCH_SIZE = 500
+    FLUSH_INTERVAL = 1.0  # seconds
+    MAX_PENDING = 10_000
+
+    def __init__(self):
+        self._queue = queue.Queue(maxsize=self.MAX_PENDING)
+        self._lock = threading.Lock()
+        self._thread = None
+        self.write_failures = 0  # records dropped because the INSERT failed
+
+    def enqueue(self, **fields) -> None:
+        """
+        Queue a SecurityLog record for writing.
+
+        Args:
+            **fields: SecurityLog field values
+        """
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(fields)
+        except queue.Full:
+            # Don't block the request; write this one synchronously instead
+            self._write([fields])
+
+    def flush(self) -> None:
+        """Write every queued record now."""
+        while True:
+            batch = self._drain()
+            if not batch:
+                return
+            self._write(batch)
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='security-log-writer', daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _drain(self, timeout: float = None) -> list:
+        """Take up to BATCH_SIZE records, waiting up to timeout for the first."""
+        try:
+            batch = [self._queue.get(timeout=timeout) if timeout else self._queue.get_nowait()]
+        except queue.Empty:
+            return []
+        while len(batch) < self.BATCH_SIZE:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._drain(timeout=self.FLUSH_INTERVAL)
+            if not batch:
+                continue
+            try:
+                self._write(batch)
+            except Exception:
+                # A bad record must not stop the writer thread
+                self.write_failures += len(batch)
+                logger.exception("Dropped %d security log records", len(batch))
+            finally:
+                # This thread holds its own DB connection; release it per batch
+                close_old_connections()
+
+    def _write(self, batch: list) -> None:
+        from .models import SecurityLog
+
+        try:
+            SecurityLog.objects.bulk_create([SecurityLog(**fields) for fields in batch])
+        except DatabaseError:
+            # Auditing must never take the app down, but failures stay visible
+            self.write_failures += len(batch)
+            logger.exception("Failed to write %d security log records", len(batch))
+
+
+security_log_writer = SecurityLogWriter()
@@ -3,6 +3,7 @@ Django views for CipherChat application.
 """
 import json
 import base64
+import logging
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
@@ -21,6 +22,8 @@ from .forms import (
     SearchMessagesForm, FileUploadForm
 )
 
+logger = logging.getLogger(__name__)
+
 # TODO: Import the existing crypto engine when ready
 # import sys
 # import os
@@ -39,9 +42,10 @@ def log_security_event(operation, message, user=None, success=True, details=None
             success=success,
             details=details or {}
         )
-    except Exception as e:
-        # Fallback logging if database logging fails
-        print(f"Security log error: {e}")
+    except Exception:
+        # Best-effort auditing: callers run this from their own error
+        # handlers, so a failure here must not replace the original error
+        logger.exception("Failed to write security log for %s", operation)
 
 @login_required
 def dashboard(request):
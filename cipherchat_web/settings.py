@@ -80,10 +80,16 @@ TEMPLATES = [
 WSGI_APPLICATION = 'cipherchat_web.wsgi.application'
 
 # Database
+# Keep connections open between requests instead of reconnecting every time;
+# health checks replace a connection that went away while idle
+DB_CONN_MAX_AGE = config('DB_CONN_MAX_AGE', default=600, cast=int)
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -91,7 +97,25 @@ DATABASES = {
 import dj_database_url
 DATABASE_URL = config('DATABASE_URL', default=None)
 if DATABASE_URL:
-    DATABASES['default'] = dj_database_url.parse(DATABASE_URL)
+    DATABASES['default'] = dj_database_url.parse(
+        DATABASE_URL, conn_max_age=DB_CONN_MAX_AGE, conn_health_checks=True
+    )
+
+# Cache and sessions
+# With Redis available, keep sessions in the cache so authenticated requests
+# skip the django_session SELECT/UPDATE; cached_db still writes through to the
+# database so a cache flush does not log everyone out. A unix socket URL
+# (unix:///var/run/redis/redis.sock) avoids TCP overhead on a local Redis.
+REDIS_URL = config('REDIS_URL', default=None)
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+    SESSION_ENGINE = config('SESSION_ENGINE', default='django.contrib.sessions.backends.cached_db')
+    SESSION_CACHE_ALIAS = 'default'
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -197,3 +221,9 @@ CIPHERCHAT_KEYS_DIR = BASE_DIR / 'keys'
 CIPHERCHAT_MESSAGES_DIR = BASE_DIR / 'messages'
 CIPHERCHAT_MAX_MESSAGE_LENGTH = 10000
 
+# Number of reverse proxies in front of the app that append to X-Forwarded-For
+# (Render's router is one); 0 trusts REMOTE_ADDR only
+CIPHERCHAT_TRUSTED_PROXY_COUNT = config(
+    'TRUSTED_PROXY_COUNT', default=1 if RENDER_EXTERNAL_HOSTNAME else 0, cast=int
+)
+
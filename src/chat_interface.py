@@ -41,6 +41,7 @@ class ChatInterface:
         self.current_user = None
         self.messages_dir = Path("messages")
         self.messages_dir.mkdir(exist_ok=True)
+        self._prompt_cache = {}
         
     def print_header(self):
         """Print the application header."""
@@ -83,7 +84,31 @@ class ChatInterface:
         
     def get_input(self, prompt: str) -> str:
         """Get user input with colored prompt."""
-        return input(f"{Fore.CYAN}❯ {prompt}: {Style.RESET_ALL}")
+        text = self._prompt_cache.get(prompt)
+        if text is None:
+            text = self._prompt_cache[prompt] = f"{Fore.CYAN}❯ {prompt}: {Style.RESET_ALL}"
+        
+        if sys.stdin.isatty():
+            return input(text)
+        
+        # Piped/scripted input: skip the readline machinery behind input()
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip("\n")
+        
+    def write_message_file(self, filepath: Path, payload: bytes):
+        """Write a message file with owner-only permissions using a raw fd."""
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+        fd = os.open(str(filepath), flags, 0o600)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
         
     def print_success(self, message: str):
         """Print success message."""
@@ -169,9 +194,12 @@ class ChatInterface:
         confirm = self.get_input(f"Are you sure you want to delete '{username}'? (yes/no)")
         if confirm.lower() == 'yes':
             if self.key_manager.delete_user_keys(username):
+                self.print_success(f"Deleted keys for user '{username}'")
                 if self.current_user == username:
                     self.current_user = None
                     self.print_info("Current user cleared")
+            else:
+                self.print_error(f"Failed to delete keys for '{username}'")
             
     def export_public_key(self):
         """Export current user's public key."""
@@ -183,7 +211,11 @@ class ChatInterface:
         if not export_path:
             export_path = None
             
-        self.key_manager.export_public_key(self.current_user, export_path)
+        exported = self.key_manager.export_public_key(self.current_user, export_path)
+        if exported:
+            self.print_success(f"Exported public key for '{self.current_user}' to: {exported}")
+        else:
+            self.print_error(f"No public key found for '{self.current_user}'")
         
     def import_public_key(self):
         """Import someone's public key."""
@@ -194,7 +226,10 @@ class ChatInterface:
             self.print_error(f"File not found: {key_file}")
             return
             
-        self.key_manager.import_public_key(username, key_file)
+        if self.key_manager.import_public_key(username, key_file):
+            self.print_success(f"Imported public key for '{username}' from: {key_file}")
+        else:
+            self.print_error("Failed to import public key (see log for details)")
         
     def list_imported_keys(self):
         """List imported public keys."""
@@ -203,10 +238,12 @@ class ChatInterface:
             self.print_info("No imported keys found")
             return
             
-        keys = []
-        for key_file in imported_dir.glob("*_public.pem"):
-            username = key_file.stem.replace("_public", "")
-            keys.append(username)
+        suffix = "_public.pem"
+        with os.scandir(imported_dir) as entries:
+            keys = [
+                entry.name[:-len(suffix)] for entry in entries
+                if entry.name.endswith(suffix) and entry.is_file(follow_symlinks=False)
+            ]
             
         if not keys:
             self.print_info("No imported keys found")
@@ -234,12 +271,12 @@ class ChatInterface:
         
         if secure_message:
             # Save message to file
-            timestamp_str = secure_message.get_timestamp_str().replace(":", "-").replace(" ", "_")
+            timestamp_str = secure_message.get_timestamp_filename()
             filename = f"{self.current_user}_to_{recipient}_{timestamp_str}.json"
             filepath = self.messages_dir / filename
             
-            with open(filepath, 'w') as f:
-                f.write(self.secure_channel.export_message_for_transmission(secure_message))
+            payload = self.secure_channel.export_message_for_transmission(secure_message).encode('utf-8')
+            self.write_message_file(filepath, payload)
                 
             self.print_success(f"Message encrypted and saved to: {filepath}")
             self.print_info("Share this file with the recipient to deliver the message")
@@ -303,8 +340,7 @@ class ChatInterface:
                 filename = f"key_exchange_{self.current_user}_to_{recipient}.json"
                 filepath = self.messages_dir / filename
                 
-                with open(filepath, 'w') as f:
-                    json.dump(key_exchange_msg, f, indent=2)
+                self.write_message_file(filepath, json.dumps(key_exchange_msg, indent=2).encode('utf-8'))
                     
                 self.print_success(f"Key exchange message saved to: {filepath}")
                 self.print_info("Share this file with the recipient")
@@ -327,6 +363,8 @@ class ChatInterface:
                 success = self.secure_channel.process_key_exchange(key_data)
                 if success:
                     self.print_success("Key exchange processed successfully")
+                else:
+                    self.print_error("Failed to store the exchanged public key")
                     
             except Exception as e:
                 self.print_error(f"Failed to process key exchange: {e}")
@@ -339,7 +377,11 @@ class ChatInterface:
             self.print_info("No messages found")
             return
             
-        message_files = list(self.messages_dir.glob("*.json"))
+        with os.scandir(self.messages_dir) as entries:
+            message_files = [
+                entry.name for entry in entries
+                if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+            ]
         
         if not message_files:
             self.print_info("No messages found")
@@ -347,7 +389,7 @@ class ChatInterface:
             
         print(f"\n{Fore.YELLOW}📁 Saved Messages:")
         for i, msg_file in enumerate(sorted(message_files), 1):
-            print(f"{Fore.WHITE}{i}. {msg_file.name}")
+            print(f"{Fore.WHITE}{i}. {msg_file}")
             
     def show_help(self):
         """Show help information."""
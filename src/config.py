@@ -4,14 +4,14 @@ Handles application configuration and environment variables.
 """
 
 import os
-from pathlib import Path
 from typing import Any, Dict, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CipherChatConfig:
-    """Configuration settings for CipherChat."""
+    """Configuration settings for CipherChat (immutable once created)."""
     
     # Cryptographic settings
     rsa_key_size: int = 2048
@@ -37,45 +37,38 @@ class CipherChatConfig:
     enable_performance_metrics: bool = False
     cache_public_keys: bool = True
     
+    # Result of the one-time validation performed in __post_init__
+    _validated: bool = field(default=False, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Validate settings once; the instance is frozen afterwards."""
+        object.__setattr__(self, '_validated', self._check_settings())
+    
     @classmethod
     def from_env(cls) -> 'CipherChatConfig':
-        """Create configuration from environment variables."""
-        return cls(
-            rsa_key_size=int(os.getenv('CIPHERCHAT_RSA_KEY_SIZE', '2048')),
-            aes_key_size=int(os.getenv('CIPHERCHAT_AES_KEY_SIZE', '32')),
-            keys_directory=os.getenv('CIPHERCHAT_KEYS_DIR', 'keys'),
-            messages_directory=os.getenv('CIPHERCHAT_MESSAGES_DIR', 'messages'),
-            temp_directory=os.getenv('CIPHERCHAT_TEMP_DIR', 'temp'),
-            max_message_size=int(os.getenv('CIPHERCHAT_MAX_MESSAGE_SIZE', str(1024 * 1024))),
-            session_timeout=int(os.getenv('CIPHERCHAT_SESSION_TIMEOUT', '3600')),
-            enable_key_rotation=os.getenv('CIPHERCHAT_ENABLE_KEY_ROTATION', 'True').lower() == 'true',
-            log_level=os.getenv('CIPHERCHAT_LOG_LEVEL', 'INFO'),
-            log_file=os.getenv('CIPHERCHAT_LOG_FILE'),
-            enable_console_logging=os.getenv('CIPHERCHAT_ENABLE_CONSOLE_LOGGING', 'True').lower() == 'true',
-            enable_performance_metrics=os.getenv('CIPHERCHAT_ENABLE_PERFORMANCE_METRICS', 'False').lower() == 'true',
-            cache_public_keys=os.getenv('CIPHERCHAT_CACHE_PUBLIC_KEYS', 'True').lower() == 'true',
-        )
+        """
+        Create configuration from environment variables.
+        
+        The result is memoized per class; call
+        ``CipherChatConfig.clear_env_cache()`` after changing the environment.
+        """
+        return _config_from_env(cls)
+    
+    @staticmethod
+    def clear_env_cache() -> None:
+        """Forget the memoized ``from_env`` result."""
+        _config_from_env.cache_clear()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
-        return {
-            'rsa_key_size': self.rsa_key_size,
-            'aes_key_size': self.aes_key_size,
-            'keys_directory': self.keys_directory,
-            'messages_directory': self.messages_directory,
-            'temp_directory': self.temp_directory,
-            'max_message_size': self.max_message_size,
-            'session_timeout': self.session_timeout,
-            'enable_key_rotation': self.enable_key_rotation,
-            'log_level': self.log_level,
-            'log_file': self.log_file,
-            'enable_console_logging': self.enable_console_logging,
-            'enable_performance_metrics': self.enable_performance_metrics,
-            'cache_public_keys': self.cache_public_keys,
-        }
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
     
     def validate(self) -> bool:
-        """Validate configuration settings."""
+        """Validate configuration settings (checked once at creation)."""
+        return self._validated
+    
+    def _check_settings(self) -> bool:
+        """Check every configuration invariant."""
         if self.rsa_key_size < 2048:
             raise ValueError("RSA key size must be at least 2048 bits for security")
         
@@ -92,15 +85,34 @@ class CipherChatConfig:
     
     def ensure_directories(self) -> None:
         """Ensure all required directories exist."""
-        dirs = [
+        for directory in (
             self.keys_directory,
             self.messages_directory,
             self.temp_directory,
             os.path.join(self.keys_directory, "imported"),
-        ]
-        
-        for directory in dirs:
-            Path(directory).mkdir(parents=True, exist_ok=True)
+        ):
+            os.makedirs(directory, exist_ok=True)
+
+
+@lru_cache(maxsize=None)
+def _config_from_env(cls) -> CipherChatConfig:
+    """Build a configuration from a single snapshot of the environment."""
+    env = os.environ
+    return cls(
+        rsa_key_size=int(env.get('CIPHERCHAT_RSA_KEY_SIZE', '2048')),
+        aes_key_size=int(env.get('CIPHERCHAT_AES_KEY_SIZE', '32')),
+        keys_directory=env.get('CIPHERCHAT_KEYS_DIR', 'keys'),
+        messages_directory=env.get('CIPHERCHAT_MESSAGES_DIR', 'messages'),
+        temp_directory=env.get('CIPHERCHAT_TEMP_DIR', 'temp'),
+        max_message_size=int(env.get('CIPHERCHAT_MAX_MESSAGE_SIZE', str(1024 * 1024))),
+        session_timeout=int(env.get('CIPHERCHAT_SESSION_TIMEOUT', '3600')),
+        enable_key_rotation=env.get('CIPHERCHAT_ENABLE_KEY_ROTATION', 'True').lower() == 'true',
+        log_level=env.get('CIPHERCHAT_LOG_LEVEL', 'INFO'),
+        log_file=env.get('CIPHERCHAT_LOG_FILE'),
+        enable_console_logging=env.get('CIPHERCHAT_ENABLE_CONSOLE_LOGGING', 'True').lower() == 'true',
+        enable_performance_metrics=env.get('CIPHERCHAT_ENABLE_PERFORMANCE_METRICS', 'False').lower() == 'true',
+        cache_public_keys=env.get('CIPHERCHAT_CACHE_PUBLIC_KEYS', 'True').lower() == 'true',
+    )
 
 
 # Global configuration instance
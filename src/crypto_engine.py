@@ -3,22 +3,31 @@ CipherChat Cryptographic Engine
 Implements hybrid encryption using RSA and AES for secure communication.
 """
 
-import os
-import json
 import base64
+import binascii
 import time
-from typing import Tuple, Dict, Any, Optional
-from cryptography.hazmat.primitives.asymmetric import rsa, padding
+import functools
+import operator
+import secrets
+from typing import Tuple, Dict, Any, Optional, Union
+from cryptography.hazmat.primitives.asymmetric import rsa, padding, utils
 from cryptography.hazmat.primitives import serialization, hashes
+from cryptography.hazmat.primitives import padding as sym_padding
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.backends import default_backend
-from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.exceptions import InvalidSignature, InvalidTag, UnsupportedAlgorithm
 
 from .config import config
 from .logger import logger
 from .exceptions import CryptographicError, ValidationError
 
+# Exceptions raised by cryptography (and base64 decoding) for bad input;
+# anything else is a programming error and is left to propagate
+CRYPTO_FAILURES = (ValueError, TypeError, UnsupportedAlgorithm)
+
+# Fetches the required encrypted_data fields in one C-level call
+_get_encrypted_fields = operator.itemgetter('encrypted_message', 'encrypted_key', 'iv')
+
 
 class CryptoEngine:
     """
@@ -29,12 +38,63 @@ class CryptoEngine:
     - Secure key exchange
     """
     
+    # Number of parsed key objects kept per key type
+    KEY_CACHE_SIZE = 128
+    
+    # Recommended nonce and tag sizes for AES-GCM
+    GCM_NONCE_SIZE = 12
+    GCM_TAG_SIZE = 16
+    
+    # PEM armour marker; anything else is treated as raw DER
+    PEM_PREFIX = b"-----BEGIN"
+    
+    # Shared engine returned by instance()
+    _instance: Optional['CryptoEngine'] = None
+    
+    # Padding and hash objects are immutable, so they are built once and shared
+    HASH_ALGORITHM = hashes.SHA256()
+    OAEP_PADDING = padding.OAEP(
+        mgf=padding.MGF1(algorithm=HASH_ALGORITHM),
+        algorithm=HASH_ALGORITHM,
+        label=None
+    )
+    PSS_PADDING = padding.PSS(
+        mgf=padding.MGF1(HASH_ALGORITHM),
+        salt_length=config.signature_salt_length
+    )
+    PREHASHED = utils.Prehashed(HASH_ALGORITHM)
+    
     def __init__(self):
-        self.backend = default_backend()
         self.rsa_key_size = config.rsa_key_size
         self.aes_key_size = config.aes_key_size
+        self.max_message_size = config.max_message_size
+        self.track_performance = config.enable_performance_metrics
+        
+        # Parsed keys are cached by their PEM bytes so repeated operations
+        # with the same key skip the PEM/ASN.1 decoding step
+        self._cached_private_key = functools.lru_cache(maxsize=self.KEY_CACHE_SIZE)(self._parse_private_key)
+        if config.cache_public_keys:
+            self._cached_public_key = functools.lru_cache(maxsize=self.KEY_CACHE_SIZE)(self._parse_public_key)
+        else:
+            self._cached_public_key = self._parse_public_key
         logger.debug(f"CryptoEngine initialized with RSA {self.rsa_key_size}-bit, AES {self.aes_key_size*8}-bit")
         
+    @classmethod
+    def instance(cls) -> 'CryptoEngine':
+        """Return the process-wide shared engine, creating it on first use."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def _start_timer(self) -> int:
+        """Start a performance timer; returns 0 when metrics are disabled."""
+        return time.perf_counter_ns() if self.track_performance else 0
+    
+    def _log_duration(self, operation: str, start_time: int, details: str = "") -> None:
+        """Log the elapsed time since ``start_time`` when metrics are enabled."""
+        if self.track_performance:
+            logger.log_performance(operation, (time.perf_counter_ns() - start_time) / 1e6, details)
+    
     def generate_rsa_key_pair(self) -> Tuple[bytes, bytes]:
         """
         Generate a new RSA key pair.
@@ -46,13 +106,12 @@ class CryptoEngine:
             CryptographicError: If key generation fails
         """
         try:
-            start_time = time.time()
+            start_time = self._start_timer()
             logger.debug(f"Generating RSA key pair ({self.rsa_key_size} bits)")
             
             private_key = rsa.generate_private_key(
                 public_exponent=65537,
-                key_size=self.rsa_key_size,
-                backend=self.backend
+                key_size=self.rsa_key_size
             )
             
             # Serialize private key
@@ -69,21 +128,51 @@ class CryptoEngine:
                 format=serialization.PublicFormat.SubjectPublicKeyInfo
             )
             
-            duration = (time.time() - start_time) * 1000
             logger.log_crypto_operation("RSA Key Generation", success=True)
-            logger.log_performance("RSA Key Generation", duration)
+            self._log_duration("RSA Key Generation", start_time)
             
             return private_pem, public_pem
             
-        except Exception as e:
+        except CRYPTO_FAILURES as e:
             logger.log_crypto_operation("RSA Key Generation", success=False)
-            raise CryptographicError(f"Failed to generate RSA key pair: {str(e)}", "key_generation")
+            raise CryptographicError(f"Failed to generate RSA key pair: {str(e)}", "key_generation") from e
+    
+    def _parse_private_key(self, private_key_data: bytes):
+        """Parse a PEM or DER private key without caching."""
+        if private_key_data.startswith(self.PEM_PREFIX):
+            key = serialization.load_pem_private_key(
+                private_key_data,
+                password=None
+            )
+        else:
+            key = serialization.load_der_private_key(private_key_data, password=None)
+        # OAEP and PSS below are RSA-only; other key types would fail later
+        # with errors outside CRYPTO_FAILURES
+        if not isinstance(key, rsa.RSAPrivateKey):
+            raise TypeError(f"Expected an RSA private key, got {type(key).__name__}")
+        return key
+    
+    def _parse_public_key(self, public_key_data: bytes):
+        """Parse a PEM or DER public key without caching."""
+        if public_key_data.startswith(self.PEM_PREFIX):
+            key = serialization.load_pem_public_key(public_key_data)
+        else:
+            key = serialization.load_der_public_key(public_key_data)
+        if not isinstance(key, rsa.RSAPublicKey):
+            raise TypeError(f"Expected an RSA public key, got {type(key).__name__}")
+        return key
+    
+    def clear_key_cache(self) -> None:
+        """Drop all cached key objects (e.g. after key rotation)."""
+        self._cached_private_key.cache_clear()
+        if hasattr(self._cached_public_key, 'cache_clear'):
+            self._cached_public_key.cache_clear()
     
     def load_private_key(self, private_key_pem: bytes):
-        """Load RSA private key from PEM format.
+        """Load RSA private key from PEM (or DER) format.
         
         Args:
-            private_key_pem: Private key in PEM format
+            private_key_pem: Private key in PEM format (DER is also accepted)
             
         Returns:
             Loaded private key object
@@ -91,24 +180,21 @@ class CryptoEngine:
         Raises:
             CryptographicError: If key loading fails
         """
+        if not private_key_pem:
+            logger.error("Failed to load private key: Private key PEM data is empty")
+            raise CryptographicError("Failed to load private key: Private key PEM data is empty", "key_loading")
+        
         try:
-            if not private_key_pem:
-                raise ValidationError("Private key PEM data is empty")
-                
-            return serialization.load_pem_private_key(
-                private_key_pem,
-                password=None,
-                backend=self.backend
-            )
-        except Exception as e:
+            return self._cached_private_key(bytes(private_key_pem))
+        except CRYPTO_FAILURES as e:
             logger.error(f"Failed to load private key: {str(e)}")
-            raise CryptographicError(f"Failed to load private key: {str(e)}", "key_loading")
+            raise CryptographicError(f"Failed to load private key: {str(e)}", "key_loading") from e
     
     def load_public_key(self, public_key_pem: bytes):
-        """Load RSA public key from PEM format.
+        """Load RSA public key from PEM (or DER) format.
         
         Args:
-            public_key_pem: Public key in PEM format
+            public_key_pem: Public key in PEM format (DER is also accepted)
             
         Returns:
             Loaded public key object
@@ -116,17 +202,15 @@ class CryptoEngine:
         Raises:
             CryptographicError: If key loading fails
         """
+        if not public_key_pem:
+            logger.error("Failed to load public key: Public key PEM data is empty")
+            raise CryptographicError("Failed to load public key: Public key PEM data is empty", "key_loading")
+        
         try:
-            if not public_key_pem:
-                raise ValidationError("Public key PEM data is empty")
-                
-            return serialization.load_pem_public_key(
-                public_key_pem,
-                backend=self.backend
-            )
-        except Exception as e:
+            return self._cached_public_key(bytes(public_key_pem))
+        except CRYPTO_FAILURES as e:
             logger.error(f"Failed to load public key: {str(e)}")
-            raise CryptographicError(f"Failed to load public key: {str(e)}", "key_loading")
+            raise CryptographicError(f"Failed to load public key: {str(e)}", "key_loading") from e
     
     def generate_aes_key(self) -> bytes:
         """Generate a random AES key.
@@ -138,18 +222,68 @@ class CryptoEngine:
             CryptographicError: If key generation fails
         """
         try:
-            return os.urandom(self.aes_key_size)
-        except Exception as e:
+            return secrets.token_bytes(self.aes_key_size)
+        except (OSError, NotImplementedError) as e:
             logger.error(f"Failed to generate AES key: {str(e)}")
-            raise CryptographicError(f"Failed to generate AES key: {str(e)}", "aes_key_generation")
+            raise CryptographicError(f"Failed to generate AES key: {str(e)}", "aes_key_generation") from e
+    
+    def _encode_message(self, message: str) -> bytes:
+        """
+        Validate a plaintext message and return its UTF-8 bytes.
+        
+        Raises:
+            ValidationError: If input validation fails
+        """
+        max_message_size = self.max_message_size
+        if not message:
+            raise ValidationError("Message cannot be empty")
+        
+        # UTF-8 never uses fewer bytes than characters, so an over-long
+        # string can be rejected before paying for the encode
+        if len(message) > max_message_size:
+            raise ValidationError(f"Message exceeds maximum size of {max_message_size} bytes")
+        
+        message_bytes = message.encode('utf-8')
+        if len(message_bytes) > max_message_size:
+            raise ValidationError(f"Message exceeds maximum size of {max_message_size} bytes")
+        return message_bytes
+    
+    def _encrypt_symmetric(self, message_bytes: bytes,
+                           associated_data: Optional[bytes] = None) -> Tuple[bytes, Dict[str, str]]:
+        """
+        Encrypt message bytes with a fresh AES-GCM key.
+        
+        Args:
+            message_bytes: The encoded plaintext message
+            associated_data: Optional data authenticated (but not encrypted) by the tag
+            
+        Returns:
+            Tuple of (aes_key, base64 encoded message fields)
+        """
+        # Draw the AES key and the 96-bit GCM nonce from the CSPRNG in one call
+        random_bytes = secrets.token_bytes(self.aes_key_size + self.GCM_NONCE_SIZE)
+        aes_key, iv = random_bytes[:self.aes_key_size], random_bytes[self.aes_key_size:]
+        
+        # Encrypt and authenticate the message with AES-GCM in a single
+        # OpenSSL call; the output is the ciphertext followed by the tag
+        sealed = memoryview(AESGCM(aes_key).encrypt(iv, message_bytes, associated_data))
+        
+        return aes_key, {
+            'encrypted_message': base64.b64encode(sealed[:-self.GCM_TAG_SIZE]).decode('ascii'),
+            'iv': base64.b64encode(iv).decode('ascii'),
+            'tag': base64.b64encode(sealed[-self.GCM_TAG_SIZE:]).decode('ascii')
+        }
     
-    def encrypt_message(self, message: str, recipient_public_key_pem: bytes) -> Dict[str, str]:
+    def encrypt_message(self, message: str, recipient_public_key_pem: bytes,
+                        associated_data: Optional[bytes] = None) -> Dict[str, str]:
         """
         Encrypt a message using hybrid encryption (RSA + AES).
         
         Args:
             message: The plaintext message to encrypt
             recipient_public_key_pem: Recipient's RSA public key in PEM format
+            associated_data: Optional data bound to the ciphertext; the same
+                bytes must be passed to decrypt_message
             
         Returns:
             Dictionary containing encrypted message components
@@ -159,74 +293,118 @@ class CryptoEngine:
             ValidationError: If input validation fails
         """
         try:
-            # Input validation
-            if not message:
-                raise ValidationError("Message cannot be empty")
+            message_bytes = self._encode_message(message)
             
-            if len(message.encode('utf-8')) > config.max_message_size:
-                raise ValidationError(f"Message exceeds maximum size of {config.max_message_size} bytes")
-            
-            start_time = time.time()
+            start_time = self._start_timer()
             logger.debug(f"Encrypting message of length {len(message)}")
             
             # Load recipient's public key
             recipient_public_key = self.load_public_key(recipient_public_key_pem)
             
-            # Generate random AES key
-            aes_key = self.generate_aes_key()
-            
-            # Generate random IV for AES
-            iv = os.urandom(16)  # 128 bits for AES-CBC
-            
-            # Encrypt the message with AES
-            cipher = Cipher(
-                algorithms.AES(aes_key),
-                modes.CBC(iv),
-                backend=self.backend
-            )
-            encryptor = cipher.encryptor()
-            
-            # Pad message to be multiple of 16 bytes (AES block size)
-            message_bytes = message.encode('utf-8')
-            padding_length = 16 - (len(message_bytes) % 16)
-            padded_message = message_bytes + bytes([padding_length]) * padding_length
-            
-            encrypted_message = encryptor.update(padded_message) + encryptor.finalize()
+            aes_key, encrypted_data = self._encrypt_symmetric(message_bytes, associated_data)
             
             # Encrypt the AES key with RSA
             encrypted_aes_key = recipient_public_key.encrypt(
                 aes_key,
-                padding.OAEP(
-                    mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                    algorithm=hashes.SHA256(),
-                    label=None
-                )
+                self.OAEP_PADDING
             )
+            encrypted_data['encrypted_key'] = base64.b64encode(encrypted_aes_key).decode('ascii')
             
-            duration = (time.time() - start_time) * 1000
             logger.log_crypto_operation("Message Encryption", success=True)
-            logger.log_performance("Message Encryption", duration, f"size: {len(message)} chars")
+            self._log_duration("Message Encryption", start_time, f"size: {len(message)} chars")
             
-            # Return encrypted data as base64 encoded strings
-            return {
-                'encrypted_message': base64.b64encode(encrypted_message).decode('utf-8'),
-                'encrypted_key': base64.b64encode(encrypted_aes_key).decode('utf-8'),
-                'iv': base64.b64encode(iv).decode('utf-8')
-            }
+            return encrypted_data
             
-        except (ValidationError, CryptographicError):
-            raise
-        except Exception as e:
+        except CRYPTO_FAILURES as e:
             logger.log_crypto_operation("Message Encryption", success=False)
-            raise CryptographicError(f"Failed to encrypt message: {str(e)}", "encryption")
+            raise CryptographicError(f"Failed to encrypt message: {str(e)}", "encryption") from e
+    
+    def encrypt_message_multi(self, message: str, recipient_public_keys: Dict[str, bytes],
+                              associated_data: Optional[bytes] = None) -> Dict[str, Any]:
+        """
+        Encrypt one message for several recipients.
+        
+        The message is encrypted once with a single AES key, and that key is
+        wrapped with each recipient's RSA public key.
+        
+        Args:
+            message: The plaintext message to encrypt
+            recipient_public_keys: Mapping of recipient id to RSA public key in PEM format
+            associated_data: Optional data bound to the ciphertext; the same
+                bytes must be passed to decrypt_message
+            
+        Returns:
+            Dictionary with the shared message components and an
+            'encrypted_keys' mapping of recipient id to wrapped AES key
+            
+        Raises:
+            CryptographicError: If encryption fails
+            ValidationError: If input validation fails
+        """
+        try:
+            message_bytes = self._encode_message(message)
+            if not recipient_public_keys:
+                raise ValidationError("At least one recipient is required")
+            
+            start_time = self._start_timer()
+            logger.debug(f"Encrypting message of length {len(message)} for {len(recipient_public_keys)} recipients")
+            
+            # Load every key first so a bad key fails before any work is done
+            public_keys = {
+                recipient: self.load_public_key(public_key_pem)
+                for recipient, public_key_pem in recipient_public_keys.items()
+            }
+            
+            aes_key, encrypted_data = self._encrypt_symmetric(message_bytes, associated_data)
+            
+            encrypted_data['encrypted_keys'] = {
+                recipient: base64.b64encode(public_key.encrypt(aes_key, self.OAEP_PADDING)).decode('ascii')
+                for recipient, public_key in public_keys.items()
+            }
+            
+            logger.log_crypto_operation("Multi-Recipient Message Encryption", success=True)
+            self._log_duration("Multi-Recipient Message Encryption", start_time,
+                               f"size: {len(message)} chars, recipients: {len(public_keys)}")
+            
+            return encrypted_data
+            
+        except CRYPTO_FAILURES as e:
+            logger.log_crypto_operation("Multi-Recipient Message Encryption", success=False)
+            raise CryptographicError(f"Failed to encrypt message: {str(e)}", "encryption") from e
+    
+    @staticmethod
+    def select_recipient_data(encrypted_data: Dict[str, Any], recipient: str) -> Dict[str, str]:
+        """
+        Extract one recipient's view of a multi-recipient message.
+        
+        Args:
+            encrypted_data: Output of encrypt_message_multi
+            recipient: Recipient id used when encrypting
+            
+        Returns:
+            Dictionary suitable for decrypt_message
+            
+        Raises:
+            ValidationError: If the recipient has no wrapped key
+        """
+        encrypted_keys = encrypted_data.get('encrypted_keys') or {}
+        if recipient not in encrypted_keys:
+            raise ValidationError(f"No encrypted key for recipient: {recipient}")
+        
+        recipient_data = {k: v for k, v in encrypted_data.items() if k != 'encrypted_keys'}
+        recipient_data['encrypted_key'] = encrypted_keys[recipient]
+        return recipient_data
     
-    def decrypt_message(self, encrypted_data: Dict[str, str], private_key_pem: bytes) -> str:
+    def decrypt_message(self, encrypted_data: Dict[str, str], private_key_pem: bytes,
+                        associated_data: Optional[bytes] = None) -> str:
         """
         Decrypt a message using hybrid decryption (RSA + AES).
         
         Args:
             encrypted_data: Dictionary with encrypted message components
             private_key_pem: Recipient's RSA private key in PEM format
+            associated_data: Data the ciphertext was bound to when encrypting;
+                messages without an authentication tag are rejected when given
             
         Returns:
             Decrypted plaintext message
@@ -240,67 +418,87 @@ class CryptoEngine:
             if not encrypted_data:
                 raise ValidationError("Encrypted data cannot be empty")
             
-            required_keys = ['encrypted_message', 'encrypted_key', 'iv']
-            for key in required_keys:
-                if key not in encrypted_data:
-                    raise ValidationError(f"Missing required key: {key}")
+            try:
+                encoded_fields = _get_encrypted_fields(encrypted_data)
+            except KeyError as e:
+                raise ValidationError(f"Missing required key: {e.args[0]}")
+            
+            if associated_data is not None and 'tag' not in encrypted_data:
+                # Legacy CBC payloads can't authenticate associated data
+                raise CryptographicError("Message authentication tag is missing", "decryption")
             
-            start_time = time.time()
+            start_time = self._start_timer()
             logger.debug("Decrypting message")
             
             # Load private key
             private_key = self.load_private_key(private_key_pem)
             
-            # Decode base64 data
-            encrypted_message = base64.b64decode(encrypted_data['encrypted_message'])
-            encrypted_aes_key = base64.b64decode(encrypted_data['encrypted_key'])
-            iv = base64.b64decode(encrypted_data['iv'])
+            # Decode base64 data in one pass over the fields
+            encrypted_message, encrypted_aes_key, iv = map(binascii.a2b_base64, encoded_fields)
             
             # Decrypt the AES key with RSA
             aes_key = private_key.decrypt(
                 encrypted_aes_key,
-                padding.OAEP(
-                    mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                    algorithm=hashes.SHA256(),
-                    label=None
-                )
+                self.OAEP_PADDING
             )
             
-            # Decrypt the message with AES
-            cipher = Cipher(
-                algorithms.AES(aes_key),
-                modes.CBC(iv),
-                backend=self.backend
-            )
-            decryptor = cipher.decryptor()
-            
-            padded_message = decryptor.update(encrypted_message) + decryptor.finalize()
-            
-            # Remove padding
-            padding_length = padded_message[-1]
-            if padding_length > 16 or padding_length == 0:
-                raise CryptographicError("Invalid padding detected", "decryption")
-            
-            message = padded_message[:-padding_length]
+            if 'tag' in encrypted_data:
+                # Decrypt and authenticate the message with AES-GCM
+                tag = binascii.a2b_base64(encrypted_data['tag'])
+                try:
+                    message = AESGCM(aes_key).decrypt(iv, encrypted_message + tag, associated_data)
+                except InvalidTag as e:
+                    raise CryptographicError("Message authentication failed", "decryption") from e
+            else:
+                # Legacy AES-CBC messages (no authentication tag)
+                cipher = Cipher(
+                    algorithms.AES(aes_key),
+                    modes.CBC(iv)
+                )
+                decryptor = cipher.decryptor()
+                
+                padded_message = decryptor.update(encrypted_message) + decryptor.finalize()
+                
+                # Remove padding (constant-time check of every padding byte)
+                unpadder = sym_padding.PKCS7(algorithms.AES.block_size).unpadder()
+                try:
+                    message = unpadder.update(padded_message) + unpadder.finalize()
+                except ValueError as e:
+                    raise CryptographicError("Invalid padding detected", "decryption") from e
             
-            duration = (time.time() - start_time) * 1000
             logger.log_crypto_operation("Message Decryption", success=True)
-            logger.log_performance("Message Decryption", duration)
+            self._log_duration("Message Decryption", start_time)
             
             return message.decode('utf-8')
             
-        except (ValidationError, CryptographicError):
-            raise
-        except Exception as e:
+        except CRYPTO_FAILURES as e:
             logger.log_crypto_operation("Message Decryption", success=False)
-            raise CryptographicError(f"Failed to decrypt message: {str(e)}", "decryption")
+            raise CryptographicError(f"Failed to decrypt message: {str(e)}", "decryption") from e
+    
+    def _signed_data(self, message: Union[str, bytes, Tuple[bytes, ...]]) -> Tuple[bytes, Any]:
+        """
+        Turn a message into the data and hash algorithm passed to sign/verify.
+        
+        A tuple of byte parts is hashed incrementally, so the parts are never
+        joined into one buffer; the resulting signature is identical to one
+        over the concatenated parts.
+        """
+        if isinstance(message, tuple):
+            hasher = hashes.Hash(self.HASH_ALGORITHM)
+            for part in message:
+                hasher.update(part)
+            return hasher.finalize(), self.PREHASHED
+        if isinstance(message, str):
+            message = message.encode('utf-8')
+        return message, self.HASH_ALGORITHM
     
-    def sign_message(self, message: str, private_key_pem: bytes) -> str:
+    def sign_message(self, message: Union[str, bytes, Tuple[bytes, ...]], private_key_pem: bytes) -> str:
         """
         Create a digital signature for message authentication.
         
         Args:
-            message: The message to sign
+            message: The message to sign (str is UTF-8 encoded, bytes are used as-is,
+                a tuple of byte parts is signed as their concatenation)
             private_key_pem: Signer's private key in PEM format
             
         Returns:
@@ -315,38 +513,35 @@ class CryptoEngine:
             if not message:
                 raise ValidationError("Message cannot be empty")
             
-            start_time = time.time()
+            start_time = self._start_timer()
             logger.debug("Creating digital signature")
             
             private_key = self.load_private_key(private_key_pem)
             
+            data, algorithm = self._signed_data(message)
             signature = private_key.sign(
-                message.encode('utf-8'),
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=config.signature_salt_length
-                ),
-                hashes.SHA256()
+                data,
+                self.PSS_PADDING,
+                algorithm
             )
             
-            duration = (time.time() - start_time) * 1000
             logger.log_crypto_operation("Message Signing", success=True)
-            logger.log_performance("Message Signing", duration)
+            self._log_duration("Message Signing", start_time)
             
-            return base64.b64encode(signature).decode('utf-8')
+            return base64.b64encode(signature).decode('ascii')
             
-        except (ValidationError, CryptographicError):
-            raise
-        except Exception as e:
+        except CRYPTO_FAILURES as e:
             logger.log_crypto_operation("Message Signing", success=False)
-            raise CryptographicError(f"Failed to sign message: {str(e)}", "signing")
+            raise CryptographicError(f"Failed to sign message: {str(e)}", "signing") from e
     
-    def verify_signature(self, message: str, signature: str, public_key_pem: bytes) -> bool:
+    def verify_signature(self, message: Union[str, bytes, Tuple[bytes, ...]], signature: str,
+                         public_key_pem: bytes) -> bool:
         """
         Verify a digital signature.
         
         Args:
-            message: The original message
+            message: The original message (str is UTF-8 encoded, bytes are used as-is,
+                a tuple of byte parts is verified as their concatenation)
             signature: Base64 encoded signature
             public_key_pem: Signer's public key in PEM format
             
@@ -364,36 +559,41 @@ class CryptoEngine:
             if not signature:
                 raise ValidationError("Signature cannot be empty")
             
-            start_time = time.time()
+            start_time = self._start_timer()
             logger.debug("Verifying digital signature")
             
             public_key = self.load_public_key(public_key_pem)
-            signature_bytes = base64.b64decode(signature)
             
+            # An RSA signature is always exactly the modulus size, so reject
+            # anything else before decoding it or running RSA math
+            expected_length = (public_key.key_size + 7) // 8
+            if len(signature) != 4 * ((expected_length + 2) // 3):
+                logger.log_security_event("INVALID_SIGNATURE_LENGTH", "Signature has unexpected length")
+                return False
+            
+            signature_bytes = binascii.a2b_base64(signature)
+            if len(signature_bytes) != expected_length:
+                logger.log_security_event("INVALID_SIGNATURE_LENGTH", "Signature has unexpected length")
+                return False
+            
+            data, algorithm = self._signed_data(message)
             try:
                 public_key.verify(
                     signature_bytes,
-                    message.encode('utf-8'),
-                    padding.PSS(
-                        mgf=padding.MGF1(hashes.SHA256()),
-                        salt_length=config.signature_salt_length
-                    ),
-                    hashes.SHA256()
+                    data,
+                    self.PSS_PADDING,
+                    algorithm
                 )
                 
-                duration = (time.time() - start_time) * 1000
                 logger.log_crypto_operation("Signature Verification", success=True)
-                logger.log_performance("Signature Verification", duration)
+                self._log_duration("Signature Verification", start_time)
                 return True
                 
             except InvalidSignature:
-                duration = (time.time() - start_time) * 1000
                 logger.log_security_event("INVALID_SIGNATURE", f"Signature verification failed for message")
-                logger.log_performance("Signature Verification", duration)
+                self._log_duration("Signature Verification", start_time)
                 return False
                 
-        except (ValidationError, CryptographicError):
-            raise
-        except Exception as e:
+        except CRYPTO_FAILURES as e:
             logger.log_crypto_operation("Signature Verification", success=False)
-            raise CryptographicError(f"Failed to verify signature: {str(e)}", "verification")
\ No newline at end of file
+            raise CryptographicError(f"Failed to verify signature: {str(e)}", "verification") from e
\ No newline at end of file
@@ -6,7 +6,8 @@ Handles secure storage and retrieval of cryptographic keys.
 import os
 import json
 import time
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from .crypto_engine import CryptoEngine
 from .config import config
@@ -23,16 +24,67 @@ class KeyManager:
     - Secure key file management
     """
     
-    def __init__(self, keys_directory: str = "keys"):
+    def __init__(self, keys_directory: str = "keys", crypto_engine: Optional[CryptoEngine] = None):
         """
         Initialize the key manager.
         
         Args:
             keys_directory: Directory to store key files
+            crypto_engine: Engine to use (defaults to the shared instance)
         """
         self.keys_dir = Path(keys_directory)
         self.keys_dir.mkdir(exist_ok=True)
-        self.crypto_engine = CryptoEngine()
+        self.crypto_engine = crypto_engine or CryptoEngine.instance()
+        
+        # (kind, username) -> (key bytes, (st_ino, st_mtime_ns, st_size))
+        self._key_cache: Dict[Tuple[str, str], Tuple[bytes, Tuple[int, int, int]]] = {}
+        # username -> (public key bytes, decoded text)
+        self._text_cache: Dict[str, Tuple[bytes, str]] = {}
+        
+    def _key_path(self, kind: str, username: str) -> str:
+        """Build the path of a key file ('private', 'public' or 'imported')."""
+        if kind == 'imported':
+            return os.path.join(self.keys_dir, "imported", f"{username}_public.pem")
+        return os.path.join(self.keys_dir, username, f"{username}_{kind}.pem")
+    
+    def _load_cached(self, kind: str, username: str) -> Optional[bytes]:
+        """
+        Load a key file, serving it from memory while the file is unchanged.
+        
+        Args:
+            kind: 'private', 'public' or 'imported'
+            username: The username
+            
+        Returns:
+            Key bytes or None if the file does not exist
+        """
+        cache_key = (kind, username)
+        path = self._key_path(kind, username)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            self._key_cache.pop(cache_key, None)
+            return None
+        
+        file_id = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        cached = self._key_cache.get(cache_key)
+        if cached is not None and cached[1] == file_id:
+            return cached[0]
+        
+        if kind == 'imported':
+            with open(path, 'rb') as f:
+                data = f.read()
+        else:
+            data = SecureFileManager.secure_read(path, SecurityValidator.MAX_KEY_FILE_SIZE)
+        
+        self._key_cache[cache_key] = (data, file_id)
+        return data
+    
+    def invalidate(self, username: str) -> None:
+        """Drop any cached keys for a user."""
+        for kind in ('private', 'public', 'imported'):
+            self._key_cache.pop((kind, username), None)
+        self._text_cache.pop(username, None)
         
     def generate_user_keys(self, username: str) -> Tuple[str, str]:
         """
@@ -55,11 +107,13 @@ class KeyManager:
             if self.user_exists(username):
                 raise KeyManagementError(f"User '{username}' already exists", username)
             
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             logger.info(f"Generating key pair for user: {username}")
             # Generate key pair
             private_key_pem, public_key_pem = self.crypto_engine.generate_rsa_key_pair()
             
+            self.invalidate(username)
+            
             # Create user directory
             user_dir = self.keys_dir / username
             user_dir.mkdir(exist_ok=True, mode=0o700)  # Secure directory permissions
@@ -86,7 +140,7 @@ class KeyManager:
             metadata_json = json.dumps(metadata, indent=2).encode('utf-8')
             SecureFileManager.secure_write(str(metadata_path), metadata_json, 0o644)
             
-            duration = (time.time() - start_time) * 1000
+            duration = (time.perf_counter_ns() - start_ns) / 1e6
             logger.info(f"✅ Generated key pair for user '{username}' in {duration:.2f}ms")
             logger.info(f"   Private key: {private_key_path}")
             logger.info(f"   Public key: {public_key_path}")
@@ -101,6 +155,36 @@ class KeyManager:
             security_auditor.log_security_event('KEY_GENERATION_FAILED', str(e), username)
             raise KeyManagementError(f"Failed to generate keys for user '{username}': {str(e)}", username)
     
+    def generate_user_keys_batch(self, usernames: List[str],
+                                 max_workers: Optional[int] = None) -> Dict[str, Tuple[str, str]]:
+        """
+        Generate key pairs for several users concurrently.
+        
+        RSA key generation runs inside OpenSSL without holding the GIL, so
+        a thread pool spreads the work across CPU cores.
+        
+        Args:
+            usernames: Usernames to generate key pairs for; repeats are generated once
+            max_workers: Thread count (defaults to the number of CPUs)
+            
+        Returns:
+            Dict mapping each successful username to (private_key_path, public_key_path);
+            failures are logged and left out
+        """
+        results: Dict[str, Tuple[str, str]] = {}
+        # Deduplicate first: two workers generating the same user could both
+        # pass the user_exists() check and write over each other's key files
+        unique_usernames = list(dict.fromkeys(usernames))
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            futures = {executor.submit(self.generate_user_keys, name): name for name in unique_usernames}
+            for future in as_completed(futures):
+                username = futures[future]
+                try:
+                    results[username] = future.result()
+                except (ValidationError, KeyManagementError) as e:
+                    logger.error(f"Batch key generation failed for '{username}': {e}")
+        return results
+    
     def load_private_key(self, username: str) -> Optional[bytes]:
         """
         Load a user's private key.
@@ -117,14 +201,10 @@ class KeyManager:
         try:
             SecurityValidator.validate_username(username)
             
-            private_key_path = self.keys_dir / username / f"{username}_private.pem"
-            
-            if not private_key_path.exists():
+            private_key_pem = self._load_cached('private', username)
+            if private_key_pem is None:
                 logger.debug(f"Private key not found for user: {username}")
-                return None
-            
-            logger.debug(f"Loading private key for user: {username}")
-            return SecureFileManager.secure_read(str(private_key_path), SecurityValidator.MAX_KEY_FILE_SIZE)
+            return private_key_pem
             
         except ValidationError as e:
             raise KeyManagementError(f"Invalid username: {str(e)}", username)
@@ -148,14 +228,10 @@ class KeyManager:
         try:
             SecurityValidator.validate_username(username)
             
-            public_key_path = self.keys_dir / username / f"{username}_public.pem"
-            
-            if not public_key_path.exists():
+            public_key_pem = self._load_cached('public', username)
+            if public_key_pem is None:
                 logger.debug(f"Public key not found for user: {username}")
-                return None
-            
-            logger.debug(f"Loading public key for user: {username}")
-            return SecureFileManager.secure_read(str(public_key_path), SecurityValidator.MAX_KEY_FILE_SIZE)
+            return public_key_pem
             
         except ValidationError as e:
             raise KeyManagementError(f"Invalid username: {str(e)}", username)
@@ -163,6 +239,32 @@ class KeyManager:
             security_auditor.log_security_event('KEY_LOAD_FAILED', f'Failed to load public key: {str(e)}', username)
             raise KeyManagementError(f"Failed to load public key for '{username}': {str(e)}", username)
     
+    def load_public_key_text(self, username: str) -> Optional[str]:
+        """
+        Load a user's public key as text, decoding it once per key file.
+        
+        Args:
+            username: The username
+            
+        Returns:
+            Public key PEM string or None if not found
+            
+        Raises:
+            KeyManagementError: If key loading fails
+        """
+        public_key_pem = self.load_public_key(username)
+        if public_key_pem is None:
+            return None
+        
+        # The byte cache hands back the same object while the file is unchanged
+        cached = self._text_cache.get(username)
+        if cached is not None and cached[0] is public_key_pem:
+            return cached[1]
+        
+        text = public_key_pem.decode('ascii')
+        self._text_cache[username] = (public_key_pem, text)
+        return text
+    
     def user_exists(self, username: str) -> bool:
         """
         Check if a user has generated keys.
@@ -173,11 +275,7 @@ class KeyManager:
         Returns:
             True if user exists, False otherwise
         """
-        user_dir = self.keys_dir / username
-        private_key_path = user_dir / f"{username}_private.pem"
-        public_key_path = user_dir / f"{username}_public.pem"
-        
-        return private_key_path.exists() and public_key_path.exists()
+        return self._has_keypair(os.path.join(self.keys_dir, username), username)
     
     def list_users(self) -> list:
         """
@@ -186,11 +284,25 @@ class KeyManager:
         Returns:
             List of usernames
         """
-        users = []
-        for user_dir in self.keys_dir.iterdir():
-            if user_dir.is_dir() and self.user_exists(user_dir.name):
-                users.append(user_dir.name)
-        return sorted(users)
+        with os.scandir(self.keys_dir) as entries:
+            return sorted(
+                entry.name for entry in entries
+                if entry.is_dir(follow_symlinks=False) and self._has_keypair(entry.path, entry.name)
+            )
+    
+    @staticmethod
+    def _has_keypair(user_dir: str, username: str) -> bool:
+        """Check for both key files with a single directory read."""
+        wanted = {f"{username}_private.pem", f"{username}_public.pem"}
+        try:
+            with os.scandir(user_dir) as entries:
+                for entry in entries:
+                    wanted.discard(entry.name)
+                    if not wanted:
+                        return True
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        return False
     
     def export_public_key(self, username: str, export_path: str = None) -> Optional[str]:
         """
@@ -213,7 +325,7 @@ class KeyManager:
         with open(export_path, 'wb') as f:
             f.write(public_key_pem)
         
-        print(f"✅ Exported public key for '{username}' to: {export_path}")
+        logger.info("Exported public key for '%s' to: %s", username, export_path)
         return export_path
     
     def import_public_key(self, username: str, public_key_file: str) -> bool:
@@ -228,27 +340,47 @@ class KeyManager:
             True if import successful, False otherwise
         """
         try:
-            # Verify it's a valid public key
             with open(public_key_file, 'rb') as f:
                 public_key_pem = f.read()
+        except OSError as e:
+            logger.error("Failed to import public key: %s", e)
+            return False
+        
+        return self.import_public_key_bytes(username, public_key_pem, source=public_key_file)
+    
+    def import_public_key_bytes(self, username: str, public_key_pem: bytes, source: str = None) -> bool:
+        """
+        Import a public key that is already in memory.
+        
+        Args:
+            username: The username to associate with the key
+            public_key_pem: Public key in PEM format
+            source: Optional description of where the key came from
             
+        Returns:
+            True if import successful, False otherwise
+        """
+        try:
             # Test loading the key to validate format
             self.crypto_engine.load_public_key(public_key_pem)
             
-            # Create directory for imported keys
-            imported_keys_dir = self.keys_dir / "imported"
-            imported_keys_dir.mkdir(exist_ok=True)
-            
-            # Save the imported public key
-            import_path = imported_keys_dir / f"{username}_public.pem"
-            with open(import_path, 'wb') as f:
-                f.write(public_key_pem)
-            
-            print(f"✅ Imported public key for '{username}' from: {public_key_file}")
+            # Save the imported public key. keys_dir is trusted configuration
+            # and may contain '~' or '..'; only the file name comes from the
+            # caller, so that is the part checked
+            import_path = self._key_path('imported', username)
+            file_name = f"{username}_public.pem"
+            if (os.path.basename(import_path) != file_name
+                    or SecurityValidator.DANGEROUS_PATH_PATTERN.search(file_name)):
+                raise SecurityError(f"Invalid username for key import: {username!r}")
+            SecureFileManager.secure_write(import_path, public_key_pem, 0o644, validate_path=False)
+            self.invalidate(username)
+            
+            origin = f" from: {source}" if source else ""
+            logger.info("Imported public key for '%s'%s", username, origin)
             return True
             
         except Exception as e:
-            print(f"❌ Failed to import public key: {e}")
+            logger.error("Failed to import public key: %s", e)
             return False
     
     def load_imported_public_key(self, username: str) -> Optional[bytes]:
@@ -261,13 +393,7 @@ class KeyManager:
         Returns:
             Public key in PEM format or None if not found
         """
-        imported_key_path = self.keys_dir / "imported" / f"{username}_public.pem"
-        
-        if not imported_key_path.exists():
-            return None
-            
-        with open(imported_key_path, 'rb') as f:
-            return f.read()
+        return self._load_cached('imported', username)
     
     def delete_user_keys(self, username: str) -> bool:
         """
@@ -284,9 +410,10 @@ class KeyManager:
             if user_dir.exists():
                 import shutil
                 shutil.rmtree(user_dir)
-                print(f"✅ Deleted keys for user '{username}'")
+                self.invalidate(username)
+                logger.info("Deleted keys for user '%s'", username)
                 return True
             return False
         except Exception as e:
-            print(f"❌ Failed to delete keys for '{username}': {e}")
+            logger.error("Failed to delete keys for '%s': %s", username, e)
             return False
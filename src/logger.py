@@ -5,6 +5,7 @@ Provides centralized logging functionality with proper security considerations.
 
 import logging
 import os
+import re
 import sys
 from pathlib import Path
 from typing import Optional
@@ -25,24 +26,25 @@ class SecurityLogFormatter(logging.Formatter):
         'encrypted_data',
     ]
     
+    # All patterns in one case-insensitive alternation, scanned in a single pass
+    SENSITIVE_RE = re.compile('|'.join(re.escape(p) for p in SENSITIVE_PATTERNS), re.IGNORECASE)
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record while sanitizing sensitive data."""
-        # Create a copy of the record to avoid modifying the original
+        # Scan the fully formatted message so %-style arguments are covered too
+        message = record.getMessage()
+        match = self.SENSITIVE_RE.search(message)
+        if match is None:
+            return super().format(record)
+        
+        # Replace everything from the first sensitive term onwards, on a copy
+        # of the record to avoid modifying the original
         record_copy = logging.LogRecord(
             record.name, record.levelno, record.pathname, record.lineno,
-            record.msg, record.args, record.exc_info, record.funcName
+            f"{message[:match.start()]}[{match.group(0).upper()}_REDACTED]",
+            None, record.exc_info, record.funcName
         )
         
-        # Sanitize message
-        if isinstance(record_copy.msg, str):
-            for pattern in self.SENSITIVE_PATTERNS:
-                if pattern in record_copy.msg.lower():
-                    # Replace sensitive data with placeholder
-                    record_copy.msg = record_copy.msg.replace(
-                        record.msg[record.msg.lower().find(pattern):], 
-                        f"[{pattern.upper()}_REDACTED]"
-                    )
-        
         return super().format(record_copy)
 
 
@@ -50,21 +52,32 @@ class CipherChatLogger:
     """Centralized logging manager for CipherChat."""
     
     def __init__(self, name: str = "cipherchat"):
-        self.logger = logging.getLogger(name)
+        self._logger = logging.getLogger(name)
         self._configured = False
-        self.setup_logging()
+        self._perf_enabled = False
+    
+    @property
+    def logger(self) -> logging.Logger:
+        """Underlying logger, configured on first use."""
+        if not self._configured:
+            self.setup_logging()
+        return self._logger
     
     def setup_logging(self) -> None:
         """Setup logging configuration."""
         if self._configured:
             return
         
+        # Mark configured up front so logging from within setup can't recurse
+        self._configured = True
+        
         # Clear any existing handlers
-        self.logger.handlers.clear()
+        self._logger.handlers.clear()
         
         # Set log level
         log_level = getattr(logging, config.log_level.upper(), logging.INFO)
-        self.logger.setLevel(log_level)
+        self._logger.setLevel(log_level)
+        self._perf_enabled = bool(config.enable_performance_metrics)
         
         # Create formatter
         formatter = SecurityLogFormatter(
@@ -77,7 +90,7 @@ class CipherChatLogger:
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setFormatter(formatter)
             console_handler.setLevel(log_level)
-            self.logger.addHandler(console_handler)
+            self._logger.addHandler(console_handler)
         
         # File handler
         if config.log_file:
@@ -89,13 +102,16 @@ class CipherChatLogger:
                 file_handler = logging.FileHandler(config.log_file)
                 file_handler.setFormatter(formatter)
                 file_handler.setLevel(log_level)
-                self.logger.addHandler(file_handler)
+                self._logger.addHandler(file_handler)
             except Exception as e:
-                self.logger.warning(f"Failed to setup file logging: {e}")
+                self._logger.warning(f"Failed to setup file logging: {e}")
         
         # Prevent propagation to avoid duplicate logs
-        self.logger.propagate = False
-        self._configured = True
+        self._logger.propagate = False
+    
+    def invalidate_config(self) -> None:
+        """Re-read the configuration on the next log call."""
+        self._configured = False
     
     def debug(self, message: str, *args, **kwargs) -> None:
         """Log debug message."""
@@ -119,21 +135,26 @@ class CipherChatLogger:
     
     def log_security_event(self, event_type: str, details: str, username: str = None) -> None:
         """Log security-related events."""
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
         user_info = f" (User: {username})" if username else ""
-        self.logger.warning(f"SECURITY EVENT - {event_type}: {details}{user_info}")
+        self.logger.warning("SECURITY EVENT - %s: %s%s", event_type, details, user_info)
     
     def log_crypto_operation(self, operation: str, username: str = None, success: bool = True) -> None:
         """Log cryptographic operations."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         status = "SUCCESS" if success else "FAILED"
         user_info = f" (User: {username})" if username else ""
-        self.logger.info(f"CRYPTO - {operation}: {status}{user_info}")
+        self.logger.info("CRYPTO - %s: %s%s", operation, status, user_info)
     
     def log_performance(self, operation: str, duration_ms: float, details: str = "") -> None:
         """Log performance metrics."""
-        if config.enable_performance_metrics:
-            self.logger.info(f"PERFORMANCE - {operation}: {duration_ms:.2f}ms {details}")
+        if not self.logger.isEnabledFor(logging.INFO) or not self._perf_enabled:
+            return
+        self.logger.info("PERFORMANCE - %s: %.2fms %s", operation, duration_ms, details)
 
 
-# Global logger instance
+# Global logger instance (handlers are created on first use)
 logger = CipherChatLogger()
 
@@ -5,16 +5,34 @@ Provides additional security features and validation functions.
 
 import os
 import re
+import sys
+import ctypes
 import hashlib
+import functools
 import secrets
+import tempfile
 import time
-from typing import Optional, Dict, Any, List
+from collections import defaultdict, deque
+from typing import Optional, Dict, Any, Deque, List
 from pathlib import Path
+from stat import S_ISREG
 
 from .config import config
 from .logger import logger
 from .exceptions import SecurityError, ValidationError
 
+# fallocate(2) mode flags from <linux/falloc.h>
+FALLOC_FL_KEEP_SIZE = 0x01
+FALLOC_FL_PUNCH_HOLE = 0x02
+
+# Direct constructors for common algorithms, skipping hashlib.new's name lookup
+_HASH_CTORS = {
+    'sha256': hashlib.sha256,
+    'sha512': hashlib.sha512,
+    'sha1': hashlib.sha1,
+    'md5': hashlib.md5,
+}
+
 
 class SecurityValidator:
     """Security validation utilities for CipherChat."""
@@ -23,6 +41,17 @@ class SecurityValidator:
     MIN_USERNAME_LENGTH = 3
     MAX_USERNAME_LENGTH = 32
     USERNAME_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
+    RESERVED_USERNAMES = frozenset(('admin', 'root', 'system', 'config', 'test', 'null', 'undefined'))
+    
+    # Path traversal and shell metacharacters rejected in file paths
+    DANGEROUS_PATH_PATTERN = re.compile(r'\.\.|[~$|;&`]')
+    
+    # Suspicious content (basic XSS/injection markers). A script block is
+    # "<script" followed anywhere later by "</script>", which is checked with
+    # two forward searches so the scan stays linear in the message length
+    SUSPICIOUS_PATTERN = re.compile(r'javascript:|data:text/html|vbscript:', re.IGNORECASE)
+    SCRIPT_OPEN_PATTERN = re.compile(r'<script\b', re.IGNORECASE)
+    SCRIPT_CLOSE_PATTERN = re.compile(r'</script>', re.IGNORECASE)
     
     # File size limits
     MAX_KEY_FILE_SIZE = 10 * 1024  # 10KB
@@ -42,27 +71,37 @@ class SecurityValidator:
         Raises:
             ValidationError: If username is invalid
         """
-        if not username:
-            raise ValidationError("Username cannot be empty")
-        
-        if len(username) < cls.MIN_USERNAME_LENGTH:
-            raise ValidationError(f"Username must be at least {cls.MIN_USERNAME_LENGTH} characters")
-        
-        if len(username) > cls.MAX_USERNAME_LENGTH:
-            raise ValidationError(f"Username must be at most {cls.MAX_USERNAME_LENGTH} characters")
-        
-        if not cls.USERNAME_PATTERN.match(username):
-            raise ValidationError("Username can only contain letters, numbers, hyphens, and underscores")
-        
-        # Check for reserved usernames
-        reserved_names = ['admin', 'root', 'system', 'config', 'test', 'null', 'undefined']
-        if username.lower() in reserved_names:
-            raise ValidationError(f"Username '{username}' is reserved")
+        # Evaluate every rule before branching, so how long a rejection takes
+        # does not reveal which rule failed
+        name = username or ""
+        length = len(name)
+        failed = (
+            (length == 0)
+            | (length < cls.MIN_USERNAME_LENGTH) << 1
+            | (length > cls.MAX_USERNAME_LENGTH) << 2
+            | (cls.USERNAME_PATTERN.match(name) is None) << 3
+            | (name.lower() in cls.RESERVED_USERNAMES) << 4
+        )
+        if failed:
+            raise ValidationError(cls._username_error(failed, name))
         
         return True
     
     @classmethod
-    def validate_file_path(cls, file_path: str, max_size: Optional[int] = None) -> bool:
+    def _username_error(cls, failed: int, username: str) -> str:
+        """Message for the highest-priority failed username rule."""
+        if failed & 1:
+            return "Username cannot be empty"
+        if failed & 2:
+            return f"Username must be at least {cls.MIN_USERNAME_LENGTH} characters"
+        if failed & 4:
+            return f"Username must be at most {cls.MAX_USERNAME_LENGTH} characters"
+        if failed & 8:
+            return "Username can only contain letters, numbers, hyphens, and underscores"
+        return f"Username '{username}' is reserved"
+    
+    @classmethod
+    def validate_file_path(cls, file_path: str, max_size: Optional[int] = None) -> Path:
         """
         Validate file path for security.
         
@@ -71,7 +110,7 @@ class SecurityValidator:
             max_size: Maximum file size in bytes
             
         Returns:
-            True if valid, False otherwise
+            The resolved path (always truthy) if valid
             
         Raises:
             SecurityError: If path is unsafe
@@ -84,27 +123,26 @@ class SecurityValidator:
         
         # Check for path traversal attempts
         try:
-            path.resolve()
+            resolved = path.resolve()
         except (OSError, ValueError) as e:
             raise SecurityError(f"Invalid file path: {e}")
         
         # Check for dangerous path components
-        dangerous_patterns = ['..', '~', '$', '|', ';', '&', '`']
-        for pattern in dangerous_patterns:
-            if pattern in str(path):
-                raise SecurityError(f"Dangerous path component detected: {pattern}")
+        match = cls.DANGEROUS_PATH_PATTERN.search(str(path))
+        if match:
+            raise SecurityError(f"Dangerous path component detected: {match.group(0)}")
         
-        # Check file exists if validation is for existing file
-        if not path.exists():
-            return True  # Allow for new file creation
+        # One stat answers both "does it exist" and "how big is it"
+        try:
+            stat = resolved.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return resolved  # Allow for new file creation
         
         # Check file size
-        if max_size and path.is_file():
-            file_size = path.stat().st_size
-            if file_size > max_size:
-                raise ValidationError(f"File exceeds maximum size of {max_size} bytes")
+        if max_size and S_ISREG(stat.st_mode) and stat.st_size > max_size:
+            raise ValidationError(f"File exceeds maximum size of {max_size} bytes")
         
-        return True
+        return resolved
     
     @classmethod
     def validate_message_content(cls, message: str) -> bool:
@@ -123,26 +161,44 @@ class SecurityValidator:
         if not message:
             raise ValidationError("Message cannot be empty")
         
-        # Check message size
-        message_bytes = message.encode('utf-8')
-        if len(message_bytes) > config.max_message_size:
+        # Check message size. UTF-8 uses 1-4 bytes per character, so the
+        # character count alone decides most cases without encoding.
+        length = len(message)
+        if length > config.max_message_size or (
+            length * 4 > config.max_message_size
+            and len(message.encode('utf-8')) > config.max_message_size
+        ):
             raise ValidationError(f"Message exceeds maximum size of {config.max_message_size} bytes")
         
         # Check for suspicious patterns (basic XSS/injection prevention)
-        suspicious_patterns = [
-            r'<script\b[^<]*(?:(?!<\/script>)<[^<]*)*<\/script>',
-            r'javascript:',
-            r'data:text\/html',
-            r'vbscript:',
-        ]
-        
-        for pattern in suspicious_patterns:
-            if re.search(pattern, message, re.IGNORECASE):
-                logger.log_security_event("SUSPICIOUS_MESSAGE_CONTENT", 
-                                         f"Suspicious pattern detected in message")
-                # Don't raise error, just log for monitoring
+        if cls.contains_suspicious_content(message):
+            logger.log_security_event("SUSPICIOUS_MESSAGE_CONTENT", 
+                                     f"Suspicious pattern detected in message")
+            # Don't raise error, just log for monitoring
         
         return True
+    
+    @classmethod
+    def contains_suspicious_content(cls, message: str) -> bool:
+        """
+        Check a message for script blocks and script URL schemes in linear time.
+        
+        Args:
+            message: Message content to scan
+            
+        Returns:
+            True if suspicious content was found
+        """
+        # Every scheme pattern contains ':' and every script tag '<'; plain
+        # character scans rule out most messages without running a regex
+        if ':' in message and cls.SUSPICIOUS_PATTERN.search(message):
+            return True
+        if '<' not in message:
+            return False
+        # The first opening tag has the most text after it, so if any script
+        # block exists, one closes after the first "<script"
+        opening = cls.SCRIPT_OPEN_PATTERN.search(message)
+        return opening is not None and cls.SCRIPT_CLOSE_PATTERN.search(message, opening.end()) is not None
 
 
 class SecureRandom:
@@ -179,12 +235,10 @@ class IntegrityChecker:
         Returns:
             Hexadecimal hash string
         """
-        hash_obj = hashlib.new(algorithm)
-        
         try:
             with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_obj.update(chunk)
+                # Reads in large blocks and hashes with the GIL released
+                hash_obj = hashlib.file_digest(f, _HASH_CTORS.get(algorithm, algorithm))
         except IOError as e:
             logger.error(f"Failed to read file for hashing: {e}")
             raise SecurityError(f"Failed to calculate file hash: {e}")
@@ -204,18 +258,30 @@ class IntegrityChecker:
         Returns:
             True if integrity is verified, False otherwise
         """
+        # Run the same comparison whether or not the file could be hashed, so
+        # an unreadable file is not distinguishable from a mismatch by timing
         try:
             actual_hash = IntegrityChecker.calculate_file_hash(file_path, algorithm)
-            return secrets.compare_digest(actual_hash, expected_hash)
+            read_ok = True
         except SecurityError:
-            return False
+            actual_hash = _HASH_CTORS.get(algorithm, functools.partial(hashlib.new, algorithm))().hexdigest()
+            read_ok = False
+        
+        return secrets.compare_digest(actual_hash, expected_hash) and read_ok
 
 
 class SecurityAuditor:
     """Security auditing and monitoring utilities."""
     
+    # Bounds on retained events, overall and per user
+    MAX_EVENTS = 100_000
+    MAX_EVENTS_PER_USER = 1000
+    
     def __init__(self):
-        self.security_events: List[Dict[str, Any]] = []
+        self.security_events: Deque[Dict[str, Any]] = deque(maxlen=self.MAX_EVENTS)
+        self._events_by_user: Dict[str, Deque[Dict[str, Any]]] = defaultdict(
+            lambda: deque(maxlen=self.MAX_EVENTS_PER_USER)
+        )
     
     def log_security_event(self, event_type: str, details: str, username: Optional[str] = None) -> None:
         """Log a security event for auditing."""
@@ -227,20 +293,21 @@ class SecurityAuditor:
         }
         
         self.security_events.append(event)
+        if username:
+            self._events_by_user[username].append(event)
         logger.log_security_event(event_type, details, username)
     
     def get_security_events(self, event_type: Optional[str] = None, 
                            username: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get security events, optionally filtered."""
-        events = self.security_events
-        
-        if event_type:
-            events = [e for e in events if e['event_type'] == event_type]
-        
         if username:
-            events = [e for e in events if e['username'] == username]
+            events = self._events_by_user.get(username, ())
+        else:
+            events = self.security_events
         
-        return events
+        if event_type:
+            return [e for e in events if e['event_type'] == event_type]
+        return list(events)
     
     def detect_suspicious_activity(self, username: str, time_window: int = 3600) -> bool:
         """
@@ -253,11 +320,14 @@ class SecurityAuditor:
         Returns:
             True if suspicious activity detected
         """
+        # Events are appended in time order, so walk back from the newest
+        # and stop at the first one outside the window
         current_time = time.time()
-        recent_events = [
-            e for e in self.security_events
-            if e['username'] == username and (current_time - e['timestamp']) <= time_window
-        ]
+        recent_events = []
+        for e in reversed(self._events_by_user.get(username, ())):
+            if current_time - e['timestamp'] > time_window:
+                break
+            recent_events.append(e)
         
         # Check for rapid-fire failed attempts
         failed_attempts = [e for e in recent_events if 'FAILED' in e['event_type']]
@@ -281,8 +351,12 @@ class SecurityAuditor:
 class SecureFileManager:
     """Secure file operations with additional safety checks."""
     
+    # Bytes written per call when writing or overwriting files
+    IO_CHUNK_SIZE = 1 << 20
+    
     @staticmethod
-    def secure_write(file_path: str, content: bytes, permissions: int = 0o600) -> None:
+    def secure_write(file_path: str, content: bytes, permissions: int = 0o600,
+                     validate_path: bool = True) -> None:
         """
         Write file securely with proper permissions.
         
@@ -290,32 +364,47 @@ class SecureFileManager:
             file_path: Path to write to
             content: Content to write
             permissions: File permissions (octal)
+            validate_path: Set to False when the caller has already validated
+                the untrusted part of the path itself
         """
-        # Validate path
-        SecurityValidator.validate_file_path(file_path)
-        
+        # Validate path, but write to the caller's path rather than the
+        # resolved one so a symlink at the target is replaced, not followed
+        if validate_path:
+            SecurityValidator.validate_file_path(file_path)
         path = Path(file_path)
         
         # Ensure parent directory exists
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Write file atomically
-        temp_path = path.with_suffix(path.suffix + '.tmp')
+        # Write file atomically via a uniquely named temp file, which mkstemp
+        # creates with O_EXCL and owner-only permissions
+        fd, temp_name = tempfile.mkstemp(prefix=path.name + '.', suffix='.tmp', dir=path.parent)
         
         try:
-            with open(temp_path, 'wb') as f:
-                f.write(content)
-            
-            # Set permissions before moving
-            os.chmod(temp_path, permissions)
+            try:
+                if permissions != 0o600:
+                    if hasattr(os, 'fchmod'):
+                        os.fchmod(fd, permissions)
+                    else:
+                        os.chmod(temp_name, permissions)
+                
+                view = memoryview(content)
+                while view:
+                    view = view[os.write(fd, view[:SecureFileManager.IO_CHUNK_SIZE]):]
+                # Data must be on disk before the rename makes it visible
+                os.fsync(fd)
+            finally:
+                os.close(fd)
             
             # Atomic move
-            temp_path.replace(path)
+            os.replace(temp_name, path)
             
         except Exception as e:
             # Clean up temp file on error
-            if temp_path.exists():
-                temp_path.unlink()
+            try:
+                os.unlink(temp_name)
+            except FileNotFoundError:
+                pass
             raise SecurityError(f"Failed to write file securely: {e}")
     
     @staticmethod
@@ -331,10 +420,10 @@ class SecureFileManager:
             File content as bytes
         """
         # Validate path and size
-        SecurityValidator.validate_file_path(file_path, max_size)
+        path = SecurityValidator.validate_file_path(file_path, max_size)
         
         try:
-            with open(file_path, 'rb') as f:
+            with open(path, 'rb') as f:
                 if max_size:
                     content = f.read(max_size + 1)  # Read one extra byte to check size
                     if len(content) > max_size:
@@ -350,25 +439,41 @@ class SecureFileManager:
         """
         Securely delete a file by overwriting it multiple times.
         
+        On Linux, files on solid-state storage are discarded with a single
+        hole punch instead: wear levelling redirects overwrites to fresh
+        cells, so repeated random passes cost time without reaching the
+        original data.
+        
         Args:
             file_path: Path to delete
             overwrite_passes: Number of overwrite passes
         """
         path = Path(file_path)
         
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
             return
         
         try:
-            file_size = path.stat().st_size
+            file_size = stat.st_size
             
-            # Overwrite file multiple times
-            with open(path, 'r+b') as f:
-                for _ in range(overwrite_passes):
-                    f.seek(0)
-                    f.write(os.urandom(file_size))
-                    f.flush()
-                    os.fsync(f.fileno())
+            with open(path, 'r+b', buffering=0) as f:
+                if not (SecureFileManager._is_solid_state(stat.st_dev)
+                        and SecureFileManager._punch_hole(f.fileno(), file_size)):
+                    # Overwrite file multiple times, in bounded chunks so memory
+                    # use does not grow with the file size
+                    chunk_size = SecureFileManager.IO_CHUNK_SIZE
+                    for _ in range(overwrite_passes):
+                        f.seek(0)
+                        remaining = file_size
+                        while remaining:
+                            remaining -= f.write(os.urandom(min(chunk_size, remaining)))
+                        os.fsync(f.fileno())
+                
+                # The overwritten pages will not be read again
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
             
             # Finally delete the file
             path.unlink()
@@ -380,6 +485,50 @@ class SecureFileManager:
                 path.unlink()
             except Exception:
                 pass
+    
+    @staticmethod
+    def _is_solid_state(device: int) -> bool:
+        """Check sysfs for a non-rotational block device; unknown counts as rotational."""
+        if not sys.platform.startswith('linux'):
+            return False
+        
+        # Partitions keep the queue settings on their parent device
+        base = f"/sys/dev/block/{os.major(device)}:{os.minor(device)}"
+        for candidate in (f"{base}/queue/rotational", f"{base}/../queue/rotational"):
+            try:
+                with open(candidate) as f:
+                    return f.read().strip() == '0'
+            except OSError:
+                continue
+        return False
+    
+    @staticmethod
+    def _punch_hole(fd: int, length: int) -> bool:
+        """
+        Deallocate a file's blocks with fallocate(PUNCH_HOLE | KEEP_SIZE).
+        
+        Returns:
+            True if the filesystem discarded the range, False if unsupported
+        """
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+        except OSError:
+            return False
+        
+        # fallocate64 always takes 64-bit offsets; plain fallocate only does
+        # where off_t is 64-bit, so on 32-bit builds without it the overwrite
+        # fallback is used instead
+        fallocate = getattr(libc, 'fallocate64', None)
+        if fallocate is None and sys.maxsize > 2**32:
+            fallocate = getattr(libc, 'fallocate', None)
+        if fallocate is None:
+            return False
+        
+        fallocate.argtypes = (ctypes.c_int, ctypes.c_int, ctypes.c_longlong, ctypes.c_longlong)
+        if fallocate(fd, FALLOC_FL_KEEP_SIZE | FALLOC_FL_PUNCH_HOLE, 0, length) != 0:
+            return False
+        os.fsync(fd)
+        return True
 
 
 # Global security auditor instance
@@ -7,6 +7,8 @@ This script helps you start the Django web application.
 import os
 import sys
 import subprocess
+from importlib.metadata import version
+from importlib.util import find_spec
 from pathlib import Path
 
 def check_python_version():
@@ -20,13 +22,12 @@ def check_python_version():
 
 def check_dependencies():
     """Check if required packages are installed."""
-    try:
-        import django
-        print(f"✅ Django {django.get_version()}")
-        return True
-    except ImportError:
+    # Probe for the package without importing it
+    if find_spec("django") is None:
         print("❌ Django is not installed. Installing dependencies...")
         return False
+    print(f"✅ Django {version('django')}")
+    return True
 
 def install_dependencies():
     """Install required dependencies."""
@@ -0,0 +1,55 @@
+"""
+Regression tests for KeyManager public key import.
+"""
+
+import os
+import tempfile
+import unittest
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from src.key_manager import KeyManager
+
+
+class ImportPublicKeyTest(unittest.TestCase):
+    """Only keys the crypto engine can use may be imported."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.key_manager = KeyManager(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_non_rsa_key_is_rejected(self):
+        ec_public_pem = ec.generate_private_key(ec.SECP256R1()).public_key().public_bytes(
+            serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+        self.assertFalse(self.key_manager.import_public_key_bytes("carol", ec_public_pem))
+        self.assertIsNone(self.key_manager.load_imported_public_key("carol"))
+
+    def _public_key(self) -> bytes:
+        self.key_manager.generate_user_keys("alice")
+        return self.key_manager.load_public_key("alice")
+
+    def test_keys_dir_with_tilde_or_parent_component(self):
+        public_key_pem = self._public_key()
+        os.makedirs(os.path.join(self._tmp.name, "~"))
+        os.makedirs(os.path.join(self._tmp.name, "sub"))
+        for keys_dir in (os.path.join(self._tmp.name, "~", "keys"),
+                         os.path.join(self._tmp.name, "sub", "..", "keys2")):
+            with self.subTest(keys_dir=keys_dir):
+                key_manager = KeyManager(keys_dir)
+                self.assertTrue(key_manager.import_public_key_bytes("alice", public_key_pem))
+                self.assertEqual(key_manager.load_imported_public_key("alice"), public_key_pem)
+
+    def test_username_cannot_escape_imported_dir(self):
+        public_key_pem = self._public_key()
+        for username in ("../alice", "a/b", "~alice"):
+            with self.subTest(username=username):
+                self.assertFalse(self.key_manager.import_public_key_bytes(username, public_key_pem))
+
+
+if __name__ == '__main__':
+    unittest.main()
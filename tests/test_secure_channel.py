@@ -0,0 +1,63 @@
+"""
+Regression tests for message authentication in SecureChannel.
+"""
+
+import tempfile
+import unittest
+
+from src.exceptions import AuthenticationError
+from src.key_manager import KeyManager
+from src.secure_channel import SecureChannel, _ciphertext_digest, _signing_payload
+
+
+class MessageAuthenticationTest(unittest.TestCase):
+    """A message must not be attributable to anyone but its real sender."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.key_manager = KeyManager(cls._tmp.name)
+        cls.key_manager.generate_user_keys_batch(["alice", "bobby", "mally"])
+        cls.channel = SecureChannel(cls.key_manager)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def _send(self, message: str) -> dict:
+        secure_message = self.channel.send_message("alice", "bobby", message)
+        return self.channel.import_message_from_transmission(
+            self.channel.export_message_for_transmission(secure_message)
+        )
+
+    def _resign_as(self, message_data: dict, sender: str) -> None:
+        """Re-sign the ciphertext under another sender without knowing the plaintext."""
+        message_data['sender'] = sender
+        payload = _signing_payload(sender, message_data['recipient'],
+                                   _ciphertext_digest(message_data['encrypted_data']),
+                                   message_data['timestamp'])
+        message_data['signature'] = self.channel.crypto_engine.sign_message(
+            payload, self.key_manager.load_private_key(sender)
+        )
+
+    def test_round_trip(self):
+        message_data = self._send("secret from alice")
+        self.assertEqual(self.channel.receive_message(message_data, "bobby"), "secret from alice")
+
+    def test_resigned_ciphertext_is_rejected(self):
+        message_data = self._send("secret from alice")
+        self._resign_as(message_data, "mally")
+        with self.assertRaises(AuthenticationError):
+            self.channel.receive_message(message_data, "bobby")
+
+    def test_resigned_untagged_ciphertext_is_rejected(self):
+        # A legacy (tagless) payload can't carry the sender binding
+        message_data = self._send("secret from alice")
+        del message_data['encrypted_data']['tag']
+        self._resign_as(message_data, "mally")
+        with self.assertRaises(AuthenticationError):
+            self.channel.receive_message(message_data, "bobby")
+
+
+if __name__ == '__main__':
+    unittest.main()
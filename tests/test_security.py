@@ -0,0 +1,39 @@
+"""
+Regression tests for SecureFileManager.
+"""
+
+import os
+import tempfile
+import unittest
+
+from src.security import SecureFileManager
+
+
+class SecureWriteTest(unittest.TestCase):
+    """secure_write must replace a symlink at the target, never write through it."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_symlink_is_replaced_not_followed(self):
+        target = os.path.join(self.root, "target.txt")
+        with open(target, 'wb') as f:
+            f.write(b"old")
+        link = os.path.join(self.root, "key.pem")
+        os.symlink(target, link)
+
+        SecureFileManager.secure_write(link, b"new")
+
+        self.assertFalse(os.path.islink(link))
+        with open(link, 'rb') as f:
+            self.assertEqual(f.read(), b"new")
+        with open(target, 'rb') as f:
+            self.assertEqual(f.read(), b"old")
+
+
+if __name__ == '__main__':
+    unittest.main()
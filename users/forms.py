@@ -4,6 +4,7 @@ Django forms for user management.
 from django import forms
 from django.contrib.auth.forms import UserCreationForm, AuthenticationForm
 from django.contrib.auth.models import User
+from django.db.models import Q
 
 
 class CustomUserCreationForm(UserCreationForm):
@@ -60,19 +61,45 @@ class CustomUserCreationForm(UserCreationForm):
         model = User
         fields = ('username', 'first_name', 'last_name', 'email', 'password1', 'password2')
     
-    def clean_email(self):
-        """Validate that the email is unique."""
-        email = self.cleaned_data.get('email')
-        if User.objects.filter(email=email).exists():
-            raise forms.ValidationError("A user with this email already exists.")
-        return email
-    
     def clean_username(self):
-        """Validate that the username is unique."""
-        username = self.cleaned_data.get('username')
-        if User.objects.filter(username=username).exists():
-            raise forms.ValidationError("A user with this username already exists.")
-        return username
+        """
+        Return the username.
+        
+        Replaces UserCreationForm's own query; the case-insensitive
+        uniqueness check runs together with the email check in clean().
+        """
+        return self.cleaned_data.get('username')
+    
+    def clean(self):
+        """Validate that the email and username (ignoring case) are unique with a single query."""
+        cleaned_data = super().clean()
+        email = cleaned_data.get('email')
+        username = cleaned_data.get('username')
+        
+        lookup = Q()
+        if email:
+            lookup |= Q(email=email)
+        if username:
+            lookup |= Q(username__iexact=username)
+        
+        if lookup:
+            email_taken = username_taken = False
+            for taken_email, taken_username in User.objects.filter(lookup).values_list('email', 'username'):
+                if taken_email == email:
+                    email_taken = True
+                    # This row may match the username as well
+                    if username and taken_username.lower() == username.lower():
+                        username_taken = True
+                else:
+                    # A row that didn't match on email can only have matched on username
+                    username_taken = True
+            
+            if email_taken:
+                self.add_error('email', "A user with this email already exists.")
+            if username_taken:
+                self.add_error('username', "A user with this username already exists.")
+        
+        return cleaned_data
 
 
 class CustomAuthenticationForm(AuthenticationForm):
@@ -2,11 +2,16 @@
 Django views for user management.
 """
 from django.shortcuts import render, redirect
-from django.contrib.auth import login, authenticate, update_session_auth_hash, logout
+from django.contrib.auth import login, update_session_auth_hash, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.contrib.auth.forms import PasswordChangeForm
 from django.contrib.auth.models import User
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from chat.log_writer import security_log_writer
 
 from .forms import (
     CustomUserCreationForm, CustomAuthenticationForm, 
@@ -14,6 +19,57 @@ from .forms import (
 )
 
 
+LOGIN_RATE_LIMIT = 10  # failed attempts per client address
+LOGIN_RATE_WINDOW = 60  # seconds
+MAX_USER_AGENT_LENGTH = 256  # stored with each security log entry
+
+
+def _client_ip(request):
+    """
+    Address of the client, looking past the trusted reverse proxies.
+    
+    Each trusted proxy appends the address it received the request from to
+    X-Forwarded-For, so the client is the entry that many hops from the
+    right; anything further left is client-supplied and can be forged.
+    """
+    hops = settings.CIPHERCHAT_TRUSTED_PROXY_COUNT
+    if hops:
+        forwarded = [a.strip() for a in request.META.get('HTTP_X_FORWARDED_FOR', '').split(',') if a.strip()]
+        if len(forwarded) >= hops:
+            return forwarded[-hops]
+    return request.META.get('REMOTE_ADDR')
+
+
+def _login_attempts_key(request):
+    """Cache key counting failed logins for the client address."""
+    return f"login-attempts:{_client_ip(request)}"
+
+
+def _record_failed_login(key):
+    """Count a failed login; the window starts at the first failure."""
+    # add() only sets the key (and its expiry) if it is missing; incr() is
+    # atomic on Redis
+    cache.add(key, 0, LOGIN_RATE_WINDOW)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Key expired between add() and incr()
+        cache.set(key, 1, LOGIN_RATE_WINDOW)
+
+
+def _log_auth_event(request, user, operation, message):
+    """Queue a SecurityLog entry; it is written off the request path."""
+    security_log_writer.enqueue(
+        user=user,
+        operation=operation,
+        log_level='info',
+        message=message,
+        ip_address=_client_ip(request),
+        user_agent=request.META.get('HTTP_USER_AGENT', '')[:MAX_USER_AGENT_LENGTH],
+        success=True
+    )
+
+
 def register(request):
     """User registration view."""
     if request.user.is_authenticated:
@@ -25,11 +81,10 @@ def register(request):
             try:
                 user = form.save()
                 
-                # Log the user in automatically
+                # Log the user in automatically; the new account needs no
+                # second password hash to be authenticated
                 username = form.cleaned_data.get('username')
-                password = form.cleaned_data.get('password1')
-                user = authenticate(username=username, password=password)
-                login(request, user)
+                login(request, user, backend='django.contrib.auth.backends.ModelBackend')
                 
                 messages.success(request, f"Welcome to CipherChat, {username}! Your account has been created successfully.")
                 return redirect('chat:dashboard')
@@ -48,40 +103,32 @@ def user_login(request):
         return redirect('chat:dashboard')
     
     if request.method == 'POST':
+        # Throttle before the form runs the (deliberately slow) password hash
+        attempts_key = _login_attempts_key(request)
+        if cache.get(attempts_key, 0) >= LOGIN_RATE_LIMIT:
+            messages.error(request, "Too many login attempts. Please wait a minute and try again.")
+            return render(request, 'users/login.html', {'form': CustomAuthenticationForm()}, status=429)
+        
         form = CustomAuthenticationForm(request, data=request.POST)
         if form.is_valid():
-            username = form.cleaned_data.get('username')
-            password = form.cleaned_data.get('password')
-            user = authenticate(username=username, password=password)
+            cache.delete(attempts_key)
             
-            if user is not None:
-                login(request, user)
-                
-                # Handle remember me functionality
-                if not form.cleaned_data.get('remember_me'):
-                    request.session.set_expiry(0)
-                
-                # Log the login event
-                try:
-                    from chat.models import SecurityLog
-                    SecurityLog.objects.create(
-                        user=user,
-                        operation='login',
-                        log_level='info',
-                        message=f'User {username} logged in successfully',
-                        ip_address=request.META.get('REMOTE_ADDR'),
-                        user_agent=request.META.get('HTTP_USER_AGENT', ''),
-                        success=True
-                    )
-                except Exception as e:
-                    # If logging fails, continue with login
-                    pass
-                
-                messages.success(request, f"Welcome back, {username}!")
-                return redirect('chat:dashboard')
-            else:
-                messages.error(request, "Invalid username or password.")
+            # The form has already authenticated the credentials
+            user = form.get_user()
+            username = user.get_username()
+            login(request, user)
+            
+            # Handle remember me functionality
+            if not form.cleaned_data.get('remember_me'):
+                request.session.set_expiry(0)
+            
+            # Log the login event
+            _log_auth_event(request, user, 'login', f'User {username} logged in successfully')
+            
+            messages.success(request, f"Welcome back, {username}!")
+            return redirect('chat:dashboard')
         else:
+            _record_failed_login(attempts_key)
             messages.error(request, "Please correct the errors below.")
     else:
         form = CustomAuthenticationForm()
@@ -92,32 +139,36 @@ def user_login(request):
 @login_required
 def profile(request):
     """User profile view."""
+    user = request.user
+
     if request.method == 'POST':
-        profile_form = UserProfileForm(request.POST, instance=request.user)
+        profile_form = UserProfileForm(request.POST, instance=user)
         password_form = ChangePasswordForm(request.POST)
         
         if profile_form.is_valid():
-            profile_form.save()
+            # Only write the columns that changed (and nothing at all if none did)
+            if profile_form.has_changed():
+                profile_form.save(commit=False).save(update_fields=profile_form.changed_data)
             messages.success(request, "Profile updated successfully!")
             return redirect('users:profile')
         
         if password_form.is_valid():
             # Verify current password
-            if not request.user.check_password(password_form.cleaned_data['current_password']):
+            if not user.check_password(password_form.cleaned_data['current_password']):
                 messages.error(request, "Current password is incorrect.")
                 return redirect('users:profile')
             
             # Change password
             try:
-                request.user.set_password(password_form.cleaned_data['new_password1'])
-                request.user.save()
-                update_session_auth_hash(request, request.user)
+                user.set_password(password_form.cleaned_data['new_password1'])
+                user.save(update_fields=['password'])
+                update_session_auth_hash(request, user)
                 messages.success(request, "Password changed successfully!")
                 return redirect('users:profile')
             except Exception as e:
                 messages.error(request, f"Error changing password: {str(e)}")
     else:
-        profile_form = UserProfileForm(instance=request.user)
+        profile_form = UserProfileForm(instance=user)
         password_form = ChangePasswordForm()
     
     context = {
@@ -146,26 +197,11 @@ def delete_account(request):
 
 def user_logout(request):
     """Custom user logout view."""
-    from django.utils import timezone
-    
     if request.user.is_authenticated:
         username = request.user.username
         
         # Log the logout event before logging out
-        try:
-            from chat.models import SecurityLog
-            SecurityLog.objects.create(
-                user=request.user,
-                operation='logout',
-                log_level='info',
-                message=f'User {username} logged out successfully',
-                ip_address=request.META.get('REMOTE_ADDR'),
-                user_agent=request.META.get('HTTP_USER_AGENT', ''),
-                success=True
-            )
-        except Exception as e:
-            # If logging fails, continue with logout
-            pass
+        _log_auth_event(request, request.user, 'logout', f'User {username} logged out successfully')
         
         logout(request)
         messages.success(request, f"Goodbye, {username}! You have been successfully logged out.")